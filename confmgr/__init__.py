@@ -3,20 +3,52 @@ __email__   = ['miguel.ramos.pernas@cern.ch']
 
 
 # Python
-import importlib, inspect, pkgutil
+from importlib import import_module
 
 
-__all__ = []
-for loader, module_name, ispkg in pkgutil.walk_packages(__path__):
+# Objects exported by each submodule. The submodules are only imported
+# when one of their objects is accessed for the first time.
+_submodules = {
+    'core'    : ['ConfDict', 'ConfMgr', 'ConfObj', 'Config', 'config_builder'],
+    'funcs'   : ['check_configurations', 'get_configurations'],
+    'version' : ['__version__', '__version_info__'],
+    }
 
-    __all__.append(module_name)
+_objects = {n: m for m, ns in _submodules.items() for n in ns}
 
-    if not ispkg:
-        # Import all classes and functions
-        mod = importlib.import_module('confmgr.' + module_name)
+__all__ = tuple(_submodules) + tuple(_objects)
 
-        __all__ += mod.__all__
 
-        for n, c in inspect.getmembers(mod):
-            if n in mod.__all__:
-                globals()[n] = c
+def __getattr__( name ):
+    '''
+    Import the submodule defining the requested object and return it.
+    The object is stored in the package namespace, so this function is
+    only called once per object.
+
+    :param name: name of the object.
+    :type name: str
+    :returns: requested object.
+    :raises AttributeError: if the object is not exported by the package.
+    '''
+    if name in _submodules:
+        return import_module(__name__ + '.' + name)
+
+    if name not in _objects:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(
+            __name__, name))
+
+    mod = import_module(__name__ + '.' + _objects[name])
+
+    obj = globals()[name] = getattr(mod, name)
+
+    return obj
+
+
+def __dir__():
+    '''
+    List the objects in the package, including those not imported yet.
+
+    :returns: names of the objects in the package.
+    :rtype: list(str)
+    '''
+    return sorted(set(globals()) | set(__all__))
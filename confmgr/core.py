@@ -7,11 +7,19 @@ __email__  = 'miguel.ramos.pernas@cern.ch'
 
 
 # Python
-import importlib
-import xml.etree.cElementTree as et
+import ast, functools, io, os, stat, sys, uuid
+from importlib import import_module
 
+try:
+    from lxml import etree as et
+    _LXML = True
+except ImportError:
+    # Fall back to the standard library
+    import xml.etree.ElementTree as et
+    _LXML = False
 
-__all__ = ['ConfDict', 'ConfMgr', 'ConfObj', 'Config', 'config_builder']
+
+__all__ = ('ConfDict', 'ConfMgr', 'ConfObj', 'Config', 'config_builder')
 
 
 class config_builder:
@@ -27,10 +35,10 @@ class config_builder:
         ...     return a, b
         ...
         >>> print(func)
-        <confmgr.core.config_builder instance at 0x7f9895318680>
+        <confmgr.core.config_builder object at 0x7f9895318680>
         >>> c = func(a = 0, b = 2)
         >>> c
-        <confmgr.core.Config instance at 0x7f98950cb050>
+        <confmgr.core.Config object at 0x7f98950cb050>
         >>> print(c)
         func(
              a = 0
@@ -54,19 +62,241 @@ class config_builder:
         return Config(self._obj, *args, **kwargs)
 
 
+@functools.lru_cache(maxsize = None)
 def _class_path( const ):
     '''
     Return the python path to the given class constructor,
-    which consists on <module>.<class>.
+    which consists on <module>.<class>. The result is cached,
+    since the same constructors appear repeatedly in a configuration.
 
     :returns: whole python path to the given class constructor.
     :rtype: str
     '''
-    return '{}.{}'.format(const.__module__, const.__name__)
+    return f'{const.__module__}.{const.__name__}'
+
+
+@functools.lru_cache(maxsize = None)
+def _resolve( path ):
+    '''
+    Return the class constructor from its python path, as built by
+    :func:`_class_path`. The result is cached, so the import machinery
+    is only used the first time a path is found.
+
+    :param path: whole python path to the class constructor.
+    :type path: str
+    :returns: class constructor.
+    :rtype: class constructor
+    '''
+    modname, _, clsname = path.rpartition('.')
+    if modname:
+        return getattr(import_module(modname), clsname)
+    else:
+        return globals()[path]
+
+
+# Tags of the elements holding the arguments of a Config object
+_ARGS   = sys.intern('args')
+_KWARGS = sys.intern('kwargs')
+
+# Function to parse the configuration files incrementally, and its options.
+# With lxml, ignorable whitespace is dropped, deeply nested configurations
+# are allowed and entities are neither expanded nor fetched from the
+# network. Documents with entities are then rejected while parsing.
+# Otherwise defusedxml is used, if available, to reject entities.
+if _LXML:
+    _iterparse = et.iterparse
+    _PARSER_OPTIONS = {'remove_blank_text': True, 'huge_tree': True,
+                       'resolve_entities': False, 'no_network': True}
+else:
+    try:
+        from defusedxml.ElementTree import iterparse as _iterparse
+    except ImportError:
+        _iterparse = et.iterparse
+    _PARSER_OPTIONS = {}
+
+# Marker for values which have not been computed yet
+_MISSING = object()
+
+# Operations used to write the XML elements
+_OPEN, _CLOSE, _WRITE = range(3)
+
+
+def _eval_literal( txt ):
+    '''
+    Evaluate a python literal from its string representation. If the text
+    can not be evaluated, it is returned unchanged.
+
+    :param txt: string representation of the object.
+    :type txt: str
+    :returns: evaluated object or the input string.
+    '''
+    try:
+        return ast.literal_eval(txt)
+    except (SyntaxError, TypeError, ValueError):
+        return txt
+
+
+def _eval_set( txt ):
+    '''
+    Evaluate the string representation of a set. Empty sets are
+    represented as "set()", which can not be evaluated as a literal
+    before python 3.9.
+
+    :param txt: string representation of the set.
+    :type txt: str
+    :returns: evaluated set or the input string.
+    '''
+    if txt == 'set()':
+        return set()
+
+    return _eval_literal(txt)
+
+
+def _eval_frozenset( txt ):
+    '''
+    Evaluate the string representation of a frozenset, which has the
+    form "frozenset({...})", or "frozenset()" if it is empty.
+
+    :param txt: string representation of the frozenset.
+    :type txt: str
+    :returns: evaluated frozenset or the input string.
+    '''
+    if not (txt.startswith('frozenset(') and txt.endswith(')')):
+        return txt
+
+    inner = txt[len('frozenset('):-1]
+    if not inner:
+        return frozenset()
+
+    value = _eval_literal(inner)
+    if isinstance(value, set):
+        return frozenset(value)
+
+    return txt
+
+
+# Functions to build the builtin values from their text in the XML file,
+# indexed by the tag used to save them. Containers may hold objects with
+# no literal representation, in which case the raw string is kept.
+_READERS = {
+    _class_path(bool): lambda txt: txt == 'True',
+    _class_path(bytes): _eval_literal,
+    _class_path(complex): complex,
+    _class_path(dict): _eval_literal,
+    _class_path(float): float,
+    _class_path(frozenset): _eval_frozenset,
+    _class_path(int): int,
+    _class_path(list): _eval_literal,
+    _class_path(set): _eval_set,
+    _class_path(str): str,
+    _class_path(tuple): _eval_literal,
+    _class_path(type(None)): lambda txt: None,
+    }
+
+# Files saved with Python 2 use the "__builtin__" module in the tags
+_READERS.update({'__builtin__.' + p.rpartition('.')[2]: f
+                 for p, f in tuple(_READERS.items())})
+_READERS['__builtin__.long']    = int
+_READERS['__builtin__.unicode'] = str
+
+# First characters of the representations that can be parsed as literals
+_LITERAL_HEADS = frozenset('([{\'"+-.0123456789')
+
+# Named constants, which are parsed without evaluating them
+_CONSTANTS = {'True': True, 'False': False, 'None': None}
+
+
+def _parse_literal( txt ):
+    '''
+    Parse a python literal from its string representation. If the text can
+    not be parsed, it is returned unchanged. The evaluation is only tried
+    if the first character can start a literal, which avoids raising and
+    catching an exception for most plain strings. The named constants
+    "True", "False" and "None" are looked up directly.
+
+    :param txt: string representation of the object.
+    :type txt: str
+    :returns: parsed object or the input string.
+    '''
+    if txt in _CONSTANTS:
+        return _CONSTANTS[txt]
+
+    if txt[:1] in _LITERAL_HEADS:
+        return _eval_literal(txt)
+
+    return txt
+
+
+def _read_leaf( node ):
+    '''
+    Build the value stored in a XML node with no children. Builtin values
+    are built directly from the type stored in the tag. Otherwise the text
+    is parsed as a python literal.
+
+    :param node: XML node to process.
+    :type node: lxml.etree._Element
+    :returns: saved value.
+    :raises ValueError: if the node contains entity references.
+    '''
+    if _LXML and len(node) and any(c.tag is et.Entity for c in node):
+        # Entity references are not resolved, so their text would be lost
+        raise ValueError(f'Entity references are not allowed (found in '
+                         f'element "{node.tag}")')
+
+    txt = node.text or ''
+
+    reader = _READERS.get(node.tag)
+    if reader is not None:
+        return reader(txt)
+
+    return _parse_literal(txt)
+
+
+def _check_entities( root ):
+    '''
+    Check that the document of the given root element does not declare
+    entities. This is only needed with lxml, which does not expand them
+    and would drop their text, whilst defusedxml rejects them.
+
+    :param root: root element of the document.
+    :type root: lxml.etree._Element
+    :raises ValueError: if the document declares entities.
+    '''
+    dtd = root.getroottree().docinfo.internalDTD
+
+    if dtd is not None and any(True for _ in dtd.iterentities()):
+        raise ValueError('Entity declarations are not allowed')
+
+
+def _copy_permissions( src, dst ):
+    '''
+    Copy the permissions and owner of a file to another file. Nothing is
+    done if the source file does not exist. Changing the owner is only
+    allowed to privileged users, so it is skipped if it fails.
+
+    :param src: path to the file whose permissions are copied.
+    :type src: str
+    :param dst: path to the file to modify.
+    :type dst: str
+    '''
+    try:
+        st = os.stat(src)
+    except FileNotFoundError:
+        return
+
+    os.chmod(dst, stat.S_IMODE(st.st_mode))
+
+    if hasattr(os, 'chown'):
+        try:
+            os.chown(dst, st.st_uid, st.st_gid)
+        except OSError:
+            pass
 
 
 class ConfObj:
 
+    __slots__ = ()
+
     def __init__( self ):
         '''
         Base class for the configuration objects.
@@ -85,6 +315,8 @@ class ConfObj:
 
 class ConfDict(dict, ConfObj):
 
+    __slots__ = ()
+
     def __init__( self, *args, **kwargs ):
         '''
         Represent a dictionary to store configurations. Some methods of the
@@ -100,43 +332,16 @@ class ConfDict(dict, ConfObj):
     def __eq__( self, other ):
         '''
         Compare two ConfDict objects. The dictionaries are considered to
-        be equivalent if the information stored is the same.
-
-        :param other: another configuration to compare.
-        :type other: ConfMgr
-        :returns: comparison decision.
-        :rtype: bool
-        '''
-        if len(self) == len(other):
-
-            for k, v in self.items():
-
-                if k in other:
-                    if v == other[k]:
-                        continue
-
-                # A key or value does not match
-                return False
-        else:
-            # Lengths are different
-            return False
-
-        # Everything went fine
-        return True
-
-    def __ne__( self, other ):
-        '''
-        Compare two ConfDict objects. The dictionaries are considered to
-        be different if the information stored is different.
+        be equivalent if the information stored is the same. The comparison
+        is delegated to :meth:`dict.__eq__`, so it is also used to decide
+        whether they are different.
 
         :param other: another configuration to compare.
         :type other: ConfMgr
         :returns: comparison decision.
         :rtype: bool
-
-        .. seealso:: :meth:`ConfDict.__eq__`
         '''
-        return not self.__eq__(other)
+        return dict.__eq__(self, other)
 
     def __str__( self, indent = 0 ):
         '''
@@ -149,22 +354,17 @@ class ConfDict(dict, ConfObj):
         :returns: this class as a string.
         :rtype: str
         '''
-        if len(self):
-            maxl = max(map(len, self.keys()))
-        else:
-            maxl = None
+        if not self:
+            return ''
+
+        maxl = max(map(len, self))
+        ind  = indent + maxl
+        pad  = ' '*indent
 
         lines = []
         for k, v in self.items():
-
-            frmt = k.ljust(maxl)
-
-            ind = indent + maxl
-
-            if isinstance(v, Config):
-                lines.append('{:>{}} = {}'.format(frmt, ind, v.__str__(ind)))
-            else:
-                lines.append('{:>{}} = {}'.format(frmt, ind, v))
+            v = v.__str__(ind) if isinstance(v, Config) else v
+            lines.append(f'{pad}{k:<{maxl}} = {v}')
 
         return '\n'.join(lines)
 
@@ -185,18 +385,14 @@ class ConfDict(dict, ConfObj):
         all the built classes are saved.
         :rtype: dict
         '''
-        cfg = {}
-        for k, v in self.items():
-            if isinstance(v, Config):
-                cfg[k] = v()
-            else:
-                cfg[k] = v
-
-        return cfg
+        return {k: v() if isinstance(v, Config) else v
+                for k, v in self.items()}
 
 
 class ConfMgr(ConfDict):
 
+    __slots__ = ()
+
     def __init__( self, *args, **kwargs ):
         '''
         Class to manage configurations built using the :class:`Config` class. It
@@ -209,124 +405,250 @@ class ConfMgr(ConfDict):
 
     def _create_xml_node( self, root, value, name = None ):
         '''
-        Create an XML element in the given root.
+        Create an XML element in the given root. The nested elements are
+        created using an explicit stack instead of recursion. This is only
+        used when lxml is not available.
 
         :param root: XML element to write into.
-        :type root: xml.etree.cElementTree.Element
+        :type root: xml.etree.ElementTree.Element
         :param value: object to write. It can be either a Config object \
         or a class with a string representation.
         :param name: name of the new element.
         :type name: str or None
 
-        .. seealso:: :meth:`ConfMgr._from_xml_node`
+        .. seealso:: :meth:`ConfMgr._stream_node`
         '''
-        if isinstance(value, Config):
+        stack = [(root, value, name)]
 
-            el = et.SubElement(root, _class_path(value._const), name = name)
+        while stack:
 
-            arels = et.SubElement(el, 'args')
-            for v in value.args():
-                self._create_xml_node(arels, v)
+            parent, obj, name = stack.pop()
 
-            kwels = et.SubElement(el, 'kwargs')
-            for k, v in value.kwargs().items():
-                self._create_xml_node(kwels, v, k)
-        else:
-            if name is None:
-                el = et.SubElement(root, _class_path(value.__class__))
-            else:
-                el = et.SubElement(root, _class_path(value.__class__),
-                                   name = name)
-            el.text = str(value)
+            attrib = {} if name is None else {'name': name}
 
-        return el
+            if isinstance(obj, Config):
 
-    @classmethod
-    def _from_xml_node( cls, node ):
+                el = et.SubElement(parent, _class_path(obj._const),
+                                   attrib)
+                ar = et.SubElement(el, _ARGS)
+                kw = et.SubElement(el, _KWARGS)
+
+                # Pushed in reverse order, so they are created in order
+                stack.extend(reversed([(kw, v, k)
+                                       for k, v in obj.kwargs().items()]))
+                stack.extend(reversed([(ar, v, None) for v in obj.args()]))
+            else:
+                el = et.SubElement(parent, _class_path(type(obj)), attrib)
+                el.text = str(obj)
+
+    def _stream_node( self, xf, value, name = None ):
         '''
-        Extract the information from a XML node. If the node represents
-        an object, then a Config object is built with its constructor
-        and configuration. Otherwise an "eval" call is done. If it fails,
-        the raw string is saved.
+        Write an XML element using the given incremental writer. Each
+        element is serialized as soon as it is closed, so only the stack
+        of open tags is kept in memory. The nested elements are written
+        using an explicit stack instead of recursion.
 
-        :param cls: object constructor.
-        :type cls: this class constructor.
-        :param node: XML node to process.
-        :type node: xml.etree.cElementTree.Element
-        :returns: saved class as a python object.
+        :param xf: incremental XML writer.
+        :type xf: lxml.etree.xmlfile
+        :param value: object to write. It can be either a Config object \
+        or a class with a string representation.
+        :param name: name of the new element.
+        :type name: str or None
+
+        .. seealso:: :meth:`ConfMgr.from_file`
         '''
-        children = node.getchildren()
+        # Pending operations, processed in reverse order. Each of them opens
+        # or closes an element, or writes a value.
+        stack = [(_WRITE, value, name)]
+
+        while stack:
 
-        if children:
+            op, obj, name = stack.pop()
 
-            # The only children must be args and kwargs
-            arels, kwels = children
+            if op == _OPEN:
+                obj.__enter__()
+            elif op == _CLOSE:
+                obj.__exit__(None, None, None)
+            else:
+                attrib = {} if name is None else {'name': name}
 
-            a = [cls._from_xml_node(c) for c in arels.getchildren()]
+                if isinstance(obj, Config):
 
-            d = cls((c.get('name'), cls._from_xml_node(c))
-                    for c in kwels.getchildren())
+                    el = xf.element(_class_path(obj._const), attrib)
+                    ar = xf.element(_ARGS)
+                    kw = xf.element(_KWARGS)
 
-            path = node.tag
+                    ops  = [(_OPEN, el, None), (_OPEN, ar, None)]
+                    ops += [(_WRITE, v, None) for v in obj.args()]
+                    ops += [(_CLOSE, ar, None), (_OPEN, kw, None)]
+                    ops += [(_WRITE, v, k) for k, v in obj.kwargs().items()]
+                    ops += [(_CLOSE, kw, None), (_CLOSE, el, None)]
 
-            p = path.rfind('.')
-            if p > 0:
-                modname = path[:p]
-                clsname = path[p + 1:]
+                    stack.extend(reversed(ops))
+                else:
+                    with xf.element(_class_path(type(obj)), attrib):
+                        xf.write(str(obj))
 
-                const = getattr(importlib.import_module(modname), clsname)
-            else:
-                const = globals()[path]
+    def _write( self, f ):
+        '''
+        Write this class as XML in the given file object.
+
+        :param f: file object opened in binary mode.
+        :type f: file
+
+        .. seealso:: :meth:`ConfMgr.save`
+        '''
+        tag = _class_path(self.__class__)
 
-            return Config(const, *a, **d)
+        if not _LXML:
 
-        else:
+            root = et.Element(tag)
 
-            txt = node.text
+            for k, v in self.items():
+                self._create_xml_node(root, v, k)
+
+            # Serialize the tree at once and write it with a single call.
+            # ElementTree.tostring only accepts "xml_declaration" since
+            # python 3.8.
+            buf = io.BytesIO()
+            et.ElementTree(root).write(buf, encoding = 'utf-8',
+                                       xml_declaration = True)
+            f.write(buf.getvalue())
+
+            return
+
+        with et.xmlfile(f, encoding = 'utf-8') as xf:
+
+            xf.write_declaration()
 
-            try:
-                # The eval call is needed to parse, for example, some builtin
-                # classes like dictionaries, lists, sets and tuples.
-                return eval(txt)
-            except:
-                return txt
+            with xf.element(tag):
+                for k, v in self.items():
+                    self._stream_node(xf, v, k)
 
     @classmethod
     def from_file( cls, path ):
         '''
-        Build the class from a configuration file.
+        Build the class from a configuration file. The file is parsed
+        incrementally, and the objects are built as soon as their XML
+        elements are closed. Processed elements are cleared, so the whole
+        tree is never held in memory. Names are interned, since they are
+        repeated across configurations.
 
-        :param path: path to the configuration file.
-        :type path: str
+        :param path: path to the configuration file, or file object \
+        opened in binary mode.
+        :type path: str or file
         :returns: configuration manager.
         :rtype: this class type
         '''
-        tree = et.parse(path)
-        root = tree.getroot()
+        events = _iterparse(path, events = ('start', 'end'),
+                            **_PARSER_OPTIONS)
+
+        # Each frame holds the (name, value) pairs of the positional and
+        # keyword arguments of an open Config element, the list being
+        # filled and the Config element. The first frame collects the
+        # entries of the root element.
+        items = []
+        stack = [[None, items, items, None]]
+
+        # Elements which are currently open
+        nodes = []
+
+        for ev, node in events:
+
+            tag = node.tag
+
+            if ev == 'start':
+                if not nodes and _LXML:
+                    _check_entities(node)
+                if tag == _ARGS:
+                    args = []
+                    stack.append([args, [], args, nodes[-1]])
+                elif tag == _KWARGS:
+                    stack[-1][2] = stack[-1][1]
+                nodes.append(node)
+                continue
+
+            nodes.pop()
+
+            if not nodes:
+                # End of the root element. The parser is run until the end
+                # of the document, so the input is closed and any content
+                # after the root element is rejected.
+                continue
+
+            if tag != _ARGS and tag != _KWARGS:
+
+                if stack[-1][3] is node:
+                    args, kwargs, _, _ = stack.pop()
+                    value = Config(_resolve(tag), *[v for _, v in args],
+                                   **dict(kwargs))
+                else:
+                    value = _read_leaf(node)
+
+                name = node.get('name')
+                if name is not None:
+                    name = sys.intern(name)
+
+                stack[-1][2].append((name, value))
+
+                node.clear()
 
-        return cls((c.get('name'), cls._from_xml_node(c))
-                   for c in root.getchildren())
+            # Previous siblings have already been processed
+            parent = nodes[-1]
+            while parent[0] is not node:
+                del parent[0]
+
+        return cls(items)
 
     def save( self, path ):
         '''
-        Save this class on a XML file.
+        Save this class on a XML file. If lxml is available, the output
+        is written incrementally, without building the XML tree in memory.
+        When a path is given, the output is written to a temporary file in
+        the same directory, which replaces the destination only if the
+        whole configuration has been written, so a failure never leaves a
+        truncated file behind. Links are followed, and the permissions of
+        an existing file are kept. If the temporary file can not be
+        created, the destination is overwritten directly. File objects
+        are written directly as well.
 
         :param path: path to the output file (adding the '.xml' \
-        extension is recomended).
-        :type path: str
+        extension is recomended), or file object opened in binary mode.
+        :type path: str or file
         '''
-        root = et.Element(_class_path(self.__class__))
+        if hasattr(path, 'write'):
+            self._write(path)
+            return
 
-        for k, v in self.items():
-            self._create_xml_node(root, v, k)
+        path = os.path.realpath(path)
+
+        head, tail = os.path.split(path)
 
-        tree = et.ElementTree(root)
+        tmp = os.path.join(head, f'.{tail}.{uuid.uuid4().hex}.tmp')
 
-        tree.write(path)
+        try:
+            f = open(tmp, 'xb')
+        except OSError:
+            # The directory can not be written
+            with open(path, 'wb') as f:
+                self._write(f)
+            return
+
+        try:
+            with f:
+                self._write(f)
+            _copy_permissions(path, tmp)
+            os.replace(tmp, path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
 
 
 class Config(ConfObj):
 
+    __slots__ = ('_const', '_args', '_kwargs', '_built')
+
     def __init__( self, const, *args, **kwargs ):
         '''
         Class to store any class constructor plus its configuration.
@@ -366,6 +688,9 @@ class Config(ConfObj):
         self._args   = args
         self._kwargs = ConfDict(kwargs)
 
+        # Object returned by Config.build
+        self._built = _MISSING
+
     def __call__( self ):
         '''
         Return a class using the stored constructor and
@@ -378,26 +703,69 @@ class Config(ConfObj):
 
     def __eq__( self, other ):
         '''
-        Compare two Config objects.
+        Compare two Config objects. Positional arguments are compared
+        by position, since they are passed in that order to the constructor.
 
         :param other: another configurable to compare.
         :type other: Config
         :returns: comparison decision.
         :rtype: bool
         '''
-        # Check the constructor
-        m_c = (self._const == other._const)
-        if not m_c:
+        if self is other:
+            return True
+
+        if not isinstance(other, Config):
+            return NotImplemented
+
+        # Check the constructor. Classes are compared by identity, but
+        # bound methods are new objects on every attribute access.
+        if self._const is not other._const and self._const != other._const:
             return False
 
         # Check the arguments
-        m_s = (set(self._args) == set(other._args))
-        if not m_s:
+        if self._args != other._args:
             return False
 
         # Check the keyword arguments
         return self._kwargs == other._kwargs
 
+    def __hash__( self ):
+        '''
+        Compute the hash of the object from the constructor and the
+        arguments, so equivalent objects have the same hash. This is only
+        possible if all the arguments are hashable. The object must not be
+        modified while it is stored in a set or used as a dictionary key.
+
+        :returns: hash of the object.
+        :rtype: int
+        :raises TypeError: if any of the arguments is not hashable.
+        '''
+        return hash((self._const, self._args,
+                     frozenset(self._kwargs.items())))
+
+    def __getstate__( self ):
+        '''
+        Return the state of the object, used to copy and pickle it. The
+        class stored by :meth:`Config.build` is not part of the state.
+
+        :returns: constructor, arguments and keyword arguments.
+        :rtype: tuple
+        '''
+        return self._const, self._args, self._kwargs
+
+    def __setstate__( self, state ):
+        '''
+        Restore the state of the object.
+
+        :param state: constructor, arguments and keyword arguments.
+        :type state: tuple
+
+        .. seealso:: :meth:`Config.__getstate__`
+        '''
+        self._const, self._args, self._kwargs = state
+
+        self._built = _MISSING
+
     def __str__( self, indent = 0 ):
         '''
         Override the default :meth:`ConfDict.__str__` method,
@@ -411,9 +779,9 @@ class Config(ConfObj):
 
         lines = ['{}('.format(self._const.__name__)]
 
-        args = ['{:>{}}'.format(a, indent + 6) for a in self._args]
-        if args:
-            lines.append('{},\n'.join(args))
+        if self._args:
+            width = indent + 6
+            lines.append(',\n'.join(f'{a!s:>{width}}' for a in self._args))
 
         if self._kwargs:
             lines.append(self._kwargs.__str__(indent + 5))
@@ -431,6 +799,24 @@ class Config(ConfObj):
         '''
         return self._args
 
+    def build( self ):
+        '''
+        Return the class built using the stored constructor and
+        configuration. The class is only built the first time this
+        method is called, and the same object is returned afterwards.
+        If the configuration is modified, :meth:`Config.invalidate`
+        must be called to build the class again.
+
+        :returns: built class.
+        :rtype: built class type
+
+        .. seealso:: :meth:`Config.__call__`
+        '''
+        if self._built is _MISSING:
+            self._built = self()
+
+        return self._built
+
     def const( self ):
         '''
         Return the class constructor.
@@ -440,6 +826,13 @@ class Config(ConfObj):
         '''
         return self._const
 
+    def invalidate( self ):
+        '''
+        Drop the class stored by :meth:`Config.build`, so it is built
+        again on the next call.
+        '''
+        self._built = _MISSING
+
     def kwargs( self ):
         '''
         Return the keyword to be passed to the constructor.
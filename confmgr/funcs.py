@@ -7,12 +7,16 @@ __email__  = 'miguel.ramos.pernas@cern.ch'
 
 # Python
 import os, re
+from concurrent.futures import ThreadPoolExecutor
 
 # confmgr
 from confmgr.core import ConfMgr
 
 
-__all__ = ['check_configurations', 'get_configurations']
+__all__ = ('check_configurations', 'get_configurations')
+
+# Minimum number of files to read them in parallel
+_MIN_PARALLEL_FILES = 4
 
 
 def check_configurations( config, cfglst, skip = None ):
@@ -32,34 +36,39 @@ def check_configurations( config, cfglst, skip = None ):
     :returns: list of configurations matching the input.
     :rtype: list(ConfMgr)
     '''
-    cfglst_mod = [_drop(c, skip) for c in cfglst]
+    if not skip:
+        # The configurations can be compared directly
+        return [cfg for cfg in cfglst if cfg is config or cfg == config]
 
     config_mod = _drop(config, skip)
 
-    matches = []
-    for cfg, mod in zip(cfglst, cfglst_mod):
-
-        if mod == config_mod:
-            matches.append(cfg)
-
-    return matches
+    return [cfg for cfg in cfglst
+            if cfg is config or _drop(cfg, skip) == config_mod]
 
 
 def _drop( dct, drop = None ):
     '''
     Drop the information at the paths specified by the given
-    dictionary.
+    dictionary. If none of the paths is present, the input
+    dictionary is returned without making a copy.
+
     :param dct: input dictionary.
     :type dct: dict
     :param drop: information to drop.
     :type drop: dict or None
     :returns: dropped configuration.
-    :rtype: ConfMgr
+    :rtype: ConfMgr or dict
     '''
-    drop = drop or {}
+    if not drop:
+        return dct
+
+    keys = [c for c in drop if c in dct]
+    if not keys:
+        # Nothing to drop, the input can be used as it is
+        return dct
 
     out = ConfMgr(dct)
-    for c in set(dct.keys()) & set(drop.keys()):
+    for c in keys:
 
         obj = drop[c]
         if obj is not None:
@@ -71,10 +80,46 @@ def _drop( dct, drop = None ):
     return out
 
 
+def _iter_files( path ):
+    '''
+    Iterate over the files in the given directory and its subdirectories.
+    The directories are traversed with an explicit stack of
+    :func:`os.scandir` calls, which avoid an extra "stat" call per entry.
+    Files are returned in the same order as with :func:`os.walk`, and
+    directories which can not be read are skipped.
+
+    :param path: path to the directory.
+    :type path: str
+    :returns: generator over the paths to the files.
+    :rtype: generator(str)
+    '''
+    stack = [path]
+    while stack:
+
+        files, dirs = [], []
+
+        try:
+            with os.scandir(stack.pop()) as it:
+                for e in it:
+                    if e.is_dir(follow_symlinks = False):
+                        dirs.append(e.path)
+                    elif not e.is_dir():
+                        # Links to directories are skipped, like in os.walk
+                        files.append(e.path)
+        except OSError:
+            continue
+
+        yield from files
+
+        # Pushed in reverse order, so they are traversed in order
+        stack.extend(reversed(dirs))
+
+
 def get_configurations( path, pattern ):
     '''
     Get the list of current configurations in "path"
-    following the given pattern.
+    following the given pattern. If there are several files,
+    they are read in parallel using a pool of threads.
 
     :param path: path to get the configurations from.
     :type path: str
@@ -85,9 +130,11 @@ def get_configurations( path, pattern ):
     '''
     comp = re.compile(os.path.join(path, pattern))
 
-    matches = [comp.match(os.path.join(p, f))
-               for p, _, fs in os.walk(path) for f in fs]
+    paths = [f for f in _iter_files(path) if comp.match(f)]
 
-    full_lst = [ConfMgr.from_file(f.string) for f in matches if f is not None]
+    if len(paths) < _MIN_PARALLEL_FILES:
+        return list(map(ConfMgr.from_file, paths))
 
-    return full_lst
+    # Overlap the input/output and the parsing of the different files
+    with ThreadPoolExecutor(max_workers = min(8, os.cpu_count() or 4)) as ex:
+        return list(ex.map(ConfMgr.from_file, paths))
@@ -5,4 +5,4 @@ Auto-generated module holding the version of the confmgr package
 __version__ = "0.0.0.dev1"
 __version_info__ = (0, 0, 0, 'dev', 1)
 
-__all__ = ['__version__', '__version_info__']
+__all__ = ('__version__', '__version_info__')
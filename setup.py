@@ -58,8 +58,14 @@ setup(
     scripts = ['scripts/{}'.format(f) for f in os.listdir('scripts')],
 
     # Requisites
+    python_requires = '>=3.7',
+
     install_requires = ['pytest'],
 
+    # Optional requisites, providing a faster XML backend or a safer
+    # parser for the standard library backend
+    extras_require = {'lxml': ['lxml'], 'defusedxml': ['defusedxml']},
+
     # Test requirements
     setup_requires = ['pytest-runner'],
 
@@ -77,6 +83,6 @@ Auto-generated module holding the version of the confmgr package
 __version__ = "{}"
 __version_info__ = {}
 
-__all__ = ['__version__', '__version_info__']
+__all__ = ('__version__', '__version_info__')
 """.format(version, version_info))
 version_file.close()
@@ -7,13 +7,14 @@ __email__  = 'miguel.ramos.pernas@cern.ch'
 
 
 # Python
-import os
-
-# confmgr
-from confmgr import ConfMgr, Config, check_configurations
+import os, stat
 
+# pytest
+import pytest
 
-__fname__ = 'test_config.xml'
+# confmgr
+from confmgr import ConfMgr, Config, check_configurations, get_configurations
+from confmgr import core, funcs
 
 
 class A:
@@ -39,7 +40,18 @@ class B:
         self.arg2 = arg2
 
 
-def test_configmgr():
+class Unprintable:
+    '''
+    Class whose string representation can not be computed.
+    '''
+    def __str__( self ):
+        '''
+        Fail to represent the object.
+        '''
+        raise RuntimeError('Unable to represent the object')
+
+
+def test_configmgr( tmp_path ):
     '''
     Test the configuration manager constructor from a configuration file.
     '''
@@ -50,20 +62,124 @@ def test_configmgr():
 
     cfg = ConfMgr(derived = der)
 
-    path = './' + __fname__
+    path = tmp_path / 'test_config.xml'
 
-    cfg.save(path)
+    with open(path, 'wb', buffering = 1 << 20) as f:
+        cfg.save(f)
 
     # Build the configuration from the file and get the second class
-    rcfg = ConfMgr.from_file(path)
+    rcfg = ConfMgr.from_file(str(path))
 
     der = rcfg.proc_conf()['derived']
 
-    os.remove(__fname__)
-
     assert cfg == rcfg
 
 
+def test_failed_save( tmp_path ):
+    '''
+    Test that the file is not modified if saving a configuration fails.
+    '''
+    path = tmp_path / 'test_config.xml'
+
+    cfg = ConfMgr(a = 1, b = 2)
+    cfg.save(str(path))
+
+    with pytest.raises(RuntimeError):
+        ConfMgr(a = 2, b = Unprintable(), c = 3).save(str(path))
+
+    assert ConfMgr.from_file(str(path)) == cfg
+    assert [p.name for p in tmp_path.iterdir()] == [path.name]
+
+
+def test_save_link( tmp_path ):
+    '''
+    Test that saving through a link modifies the file it points to.
+    '''
+    path = tmp_path / 'test_config.xml'
+    link = tmp_path / 'link.xml'
+
+    ConfMgr(a = 1).save(str(path))
+    link.symlink_to(path)
+
+    cfg = ConfMgr(a = 2)
+    cfg.save(str(link))
+
+    assert link.is_symlink()
+    assert ConfMgr.from_file(str(path)) == cfg
+
+
+def test_save_permissions( tmp_path ):
+    '''
+    Test that saving a configuration keeps the permissions of the file.
+    '''
+    path = tmp_path / 'test_config.xml'
+
+    ConfMgr(a = 1).save(str(path))
+    path.chmod(0o600)
+
+    ConfMgr(a = 2).save(str(path))
+
+    assert stat.S_IMODE(path.stat().st_mode) == 0o600
+
+
+@pytest.mark.skipif(os.name != 'posix' or os.geteuid() == 0,
+                    reason = 'permissions are not enforced')
+def test_save_read_only_directory( tmp_path ):
+    '''
+    Test saving a configuration in a directory which can not be written.
+    '''
+    path = tmp_path / 'test_config.xml'
+
+    ConfMgr(a = 1).save(str(path))
+
+    tmp_path.chmod(0o500)
+    try:
+        cfg = ConfMgr(a = 2)
+        cfg.save(str(path))
+    finally:
+        tmp_path.chmod(0o700)
+
+    assert ConfMgr.from_file(str(path)) == cfg
+
+
+@pytest.mark.skipif(not core._LXML, reason = 'requires lxml')
+def test_save_stream():
+    '''
+    Test that configurations are written to file objects incrementally.
+    '''
+    class Writer:
+        def __init__( self ):
+            self.sizes = []
+        def write( self, data ):
+            self.sizes.append(len(data))
+
+    cfg = ConfMgr({f'k{i}': Config(A, arg = i) for i in range(1000)})
+
+    f = Writer()
+    cfg.save(f)
+
+    assert max(f.sizes) < sum(f.sizes)
+
+
+def test_config_build():
+    '''
+    Test that the built classes are cached until the configuration
+    is invalidated.
+    '''
+    cfg = Config(B, arg1 = Config(A, arg = 1), arg2 = 'name')
+
+    b = cfg.build()
+
+    assert cfg.build() is b
+    assert cfg() is not b
+
+    cfg.kwargs()['arg2'] = 'other'
+    cfg.invalidate()
+
+    assert cfg.build() is not b
+    assert cfg.build().arg2 == 'other'
+
+
 def test_check_configurations():
     '''
     Create two configurations with some differences and check
@@ -89,3 +205,43 @@ def test_check_configurations():
                                         'useless': None,
                                         'derived': {'base': {'arg': None}}
                                     })) == 0
+
+    assert check_configurations(cfg_2, [cfg_1, cfg_3],
+                                skip = {'useless': None}) == [cfg_3]
+
+
+def test_get_configurations( tmp_path ):
+    '''
+    Test reading the configurations in a directory.
+    '''
+    cfg_1 = ConfMgr(derived = Config(B, arg1 = Config(A, arg = 1), arg2 = 'a'))
+    cfg_2 = ConfMgr(value = 1)
+
+    cfg_1.save(str(tmp_path / 'cfg_1.xml'))
+    cfg_2.save(str(tmp_path / 'cfg_2.xml'))
+    cfg_2.save(str(tmp_path / 'other.xml'))
+
+    read = get_configurations(str(tmp_path), r'cfg_.*\.xml')
+
+    assert sorted(map(str, read)) == sorted(map(str, [cfg_1, cfg_2]))
+
+    # Directories which can not be read are skipped
+    assert get_configurations(str(tmp_path / 'missing'), r'.*') == []
+
+
+def test_get_configurations_nested( tmp_path ):
+    '''
+    Test reading enough configurations in nested directories for them to
+    be read in parallel.
+    '''
+    paths = ['cfg_0.xml', 'a/cfg_1.xml', 'a/b/cfg_2.xml', 'c/cfg_3.xml',
+             'c/cfg_4.xml', 'c/other.xml']
+
+    for i, p in enumerate(paths):
+        (tmp_path / p).parent.mkdir(parents = True, exist_ok = True)
+        ConfMgr(value = i).save(str(tmp_path / p))
+
+    read = get_configurations(str(tmp_path), r'(.*/)?cfg_.*\.xml')
+
+    assert len(read) >= funcs._MIN_PARALLEL_FILES
+    assert sorted(r['value'] for r in read) == list(range(5))
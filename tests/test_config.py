@@ -8,61 +8,177 @@ __email__  = 'miguel.ramos.pernas@cern.ch'
 
 
 # Python
-import os
+import functools, io
+
+# pytest
+import pytest
 
 # confmgr
 import confmgr
 
 
-__fname__ = 'test_config.xml'
-
-
-def _generate_and_check( func ):
+class ttcl:
     '''
-    Decorator to study the configuration created from an
-    input function.
-
-    :param func: input function, with no arguments, that \
-    creates a configuration dictionary.
-    :type func: function
+    Small class to test the configuration module.
     '''
-    def wrapper():
+    def __init__( self, name, first, second = 2. ):
         '''
-        Create the configuration file and read it, checking
-        that the two versions match.
+        Store some attributes.
         '''
-        cfg = confmgr.ConfMgr(func())
-        cfg.save(__fname__)
+        self.name   = name
+        self.first  = first
+        self.second = second
 
-        read = confmgr.ConfMgr.from_file(__fname__)
+    @classmethod
+    def alt( cls, first ):
+        '''
+        Alternative constructor.
+        '''
+        return cls('alt', first)
 
-        matches = confmgr.check_configurations(cfg, [read])
 
-        os.remove(__fname__)
+def test_config_equivalence():
+    '''
+    Check the equivalence behaviour of the Config class.
+    '''
+    class dummy:
+        def __init__( self, a, b ):
+            pass
 
-        assert len(matches) == 1
+    c1 = confmgr.Config(dummy, 1, 0)
+    c2 = confmgr.Config(dummy, 1, b = 0)
 
-    return wrapper
+    assert c1 != c2
 
 
-def test_config_equivalence():
+def test_config_args_order():
     '''
-    Check the equivalence behaviour of the Config class.
+    Check that the positional arguments of two Config objects are
+    compared taking into account their order.
     '''
     class dummy:
         def __init__( self, a, b ):
             pass
 
     c1 = confmgr.Config(dummy, 1, 0)
-    c2 = confmgr.Config(dummy, 1, b = 0)
+    c2 = confmgr.Config(dummy, 0, 1)
+    c3 = confmgr.Config(dummy, 1, 0)
 
     assert c1 != c2
+    assert c1 == c3
+
+
+def test_config_callable():
+    '''
+    Check that Config objects can be built from callables with no name.
+    '''
+    const = functools.partial(dict, a = 1)
+
+    c1 = confmgr.Config(const, b = 2)
+    c2 = confmgr.Config(const, b = 2)
+
+    assert c1 == c2
+    assert c1() == c1.build() == {'a': 1, 'b': 2}
+
+
+def test_config_classmethod():
+    '''
+    Check the equivalence of Config objects built from class methods,
+    which are different objects on every access.
+    '''
+    c1 = confmgr.Config(ttcl.alt, first = 1)
+    c2 = confmgr.Config(ttcl.alt, first = 1)
+    c3 = confmgr.Config(ttcl.alt, first = 2)
+
+    assert c1 == c2
+    assert c1 != c3
+    assert confmgr.check_configurations(c1, [c2, c3]) == [c2]
+
+
+def test_python2_builtins():
+    '''
+    Test reading a configuration file saved with Python 2.
+    '''
+    buf = io.BytesIO(
+        b'<confmgr.core.ConfMgr>'
+        b'<__builtin__.int name="int">1</__builtin__.int>'
+        b'<__builtin__.long name="long">2</__builtin__.long>'
+        b'<__builtin__.str name="str">1.5</__builtin__.str>'
+        b'<__builtin__.unicode name="unicode">a</__builtin__.unicode>'
+        b'<__builtin__.list name="list">[1, 2]</__builtin__.list>'
+        b'<__builtin__.NoneType name="none">None</__builtin__.NoneType>'
+        b'</confmgr.core.ConfMgr>')
+
+    read = confmgr.ConfMgr.from_file(buf)
+
+    assert read == {'int': 1, 'long': 2, 'str': '1.5', 'unicode': 'a',
+                    'list': [1, 2], 'none': None}
+
+
+def test_named_constants():
+    '''
+    Test reading the named constants stored with types which are not
+    builtins.
+    '''
+    buf = io.BytesIO(
+        b'<confmgr.core.ConfMgr>'
+        b'<numpy.bool_ name="true">True</numpy.bool_>'
+        b'<numpy.bool_ name="false">False</numpy.bool_>'
+        b'<mod.Null name="none">None</mod.Null>'
+        b'</confmgr.core.ConfMgr>')
+
+    read = confmgr.ConfMgr.from_file(buf)
+
+    assert read == {'true': True, 'false': False, 'none': None}
+    assert read['true'] is True
 
 
-@_generate_and_check
-def test_basic_config():
+def test_trailing_content():
     '''
-    Test a basic configuration.
+    Check that content after the root element is rejected.
+    '''
+    buf = io.BytesIO(
+        b'<confmgr.core.ConfMgr>'
+        b'<builtins.int name="int">1</builtins.int>'
+        b'</confmgr.core.ConfMgr><junk')
+
+    with pytest.raises(confmgr.core.et.ParseError):
+        confmgr.ConfMgr.from_file(buf)
+
+
+@pytest.mark.skipif(not confmgr.core._LXML, reason = 'requires lxml')
+@pytest.mark.parametrize('doctype', [
+    b'<!DOCTYPE confmgr.core.ConfMgr [<!ENTITY y "text">]>',
+    b'<!DOCTYPE confmgr.core.ConfMgr SYSTEM "external.dtd">',
+    ])
+def test_entities( doctype ):
+    '''
+    Check that documents with entities are rejected.
+    '''
+    buf = io.BytesIO(
+        doctype +
+        b'<confmgr.core.ConfMgr>'
+        b'<builtins.str name="str">a&y;b</builtins.str>'
+        b'</confmgr.core.ConfMgr>')
+
+    with pytest.raises(ValueError):
+        confmgr.ConfMgr.from_file(buf)
+
+
+def test_config_hash():
+    '''
+    Check that equivalent Config objects have the same hash.
+    '''
+    c1 = confmgr.Config(ttcl, 'a', first = 1)
+    c2 = confmgr.Config(ttcl, 'a', first = 1)
+    c3 = confmgr.Config(ttcl, 'a', first = 2)
+
+    assert len({c1, c2, c3}) == 2
+
+
+def _basic_config():
+    '''
+    Create a basic configuration.
     '''
     return {
         'string' : 'this is a test',
@@ -71,10 +187,9 @@ def test_basic_config():
         }
 
 
-@_generate_and_check
-def test_no_str_to_obj_builtins():
+def _no_str_to_obj_builtins():
     '''
-    Test a configuration with a dict, list, set and tuple objects.
+    Create a configuration with a dict, list, set and tuple objects.
     '''
     return {
         'dict'  : {'first': 1, 'second': 2},
@@ -84,23 +199,33 @@ def test_no_str_to_obj_builtins():
         }
 
 
-class ttcl:
+def _other_builtins():
     '''
-    Small class to test the configuration module.
+    Create a configuration with bool, None, bytes and complex objects,
+    together with an empty set.
     '''
-    def __init__( self, name, first, second = 2. ):
-        '''
-        Store some attributes.
-        '''
-        self.name   = name
-        self.first  = first
-        self.second = second
+    return {
+        'bool'    : True,
+        'none'    : None,
+        'bytes'   : b'abc',
+        'complex' : 1 + 2j,
+        'set'     : set(),
+        }
+
+
+def _frozensets():
+    '''
+    Create a configuration with empty and non-empty frozenset objects.
+    '''
+    return {
+        'empty'  : frozenset(),
+        'filled' : frozenset({1, 2}),
+        }
 
 
-@_generate_and_check
-def test_class_config():
+def _class_config():
     '''
-    Test a configuration holding a class.
+    Create a configuration holding a class.
     '''
     return {
         'string' : 'this is a test',
@@ -113,10 +238,9 @@ def test_class_config():
         }
 
 
-@_generate_and_check
-def test_empty_class():
+def _empty_class():
     '''
-    Test a configuration with a class constructor
+    Create a configuration with a class constructor
     being called with no arguments.
     '''
     return {
@@ -125,3 +249,54 @@ def test_empty_class():
         'int'    : 1,
         'float'  : 0.1
         }
+
+
+# Functions creating the configurations to save and read
+PAYLOADS = [
+    pytest.param(_basic_config, id = 'basic'),
+    pytest.param(_no_str_to_obj_builtins, id = 'builtins'),
+    pytest.param(_other_builtins, id = 'other'),
+    pytest.param(_frozensets, id = 'frozensets'),
+    pytest.param(_class_config, id = 'class'),
+    pytest.param(_empty_class, id = 'empty'),
+    ]
+
+
+@pytest.mark.parametrize('payload', PAYLOADS)
+def test_roundtrip( payload ):
+    '''
+    Save the configuration created by the given function in memory
+    and read it, checking that the two versions match.
+    '''
+    cfg = confmgr.ConfMgr(payload())
+
+    buf = io.BytesIO()
+    cfg.save(buf)
+    buf.seek(0)
+
+    read = confmgr.ConfMgr.from_file(buf)
+
+    matches = confmgr.check_configurations(cfg, [read])
+
+    assert len(matches) == 1
+
+
+@pytest.mark.parametrize('value', [
+    [1., float('inf')],
+    {'a': object()},
+    [confmgr.Config(dict, a = 1)],
+    ])
+def test_unparsable_containers( value ):
+    '''
+    Check that containers whose content can not be parsed as a python
+    literal are read as the raw string.
+    '''
+    cfg = confmgr.ConfMgr(x = value)
+
+    buf = io.BytesIO()
+    cfg.save(buf)
+    buf.seek(0)
+
+    read = confmgr.ConfMgr.from_file(buf)
+
+    assert read == {'x': str(value)}
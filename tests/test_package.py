@@ -0,0 +1,28 @@
+'''
+Test the objects exported by the package.
+'''
+
+__author__ = 'Miguel Ramos Pernas'
+__email__  = 'miguel.ramos.pernas@cern.ch'
+
+
+# Python
+import importlib
+
+# confmgr
+import confmgr
+
+
+def test_exported_objects():
+    '''
+    Check that the objects declared in the package are those exported
+    by each submodule, and that they can be accessed.
+    '''
+    for m, names in confmgr._submodules.items():
+
+        mod = importlib.import_module('confmgr.' + m)
+
+        assert sorted(names) == sorted(mod.__all__)
+
+        for n in names:
+            assert getattr(confmgr, n) is getattr(mod, n)